@@ -4,18 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import threading
+import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import aiohttp
-import feedparser
-from homeassistant.config_entries import ConfigEntry
+import orjson
+import yarl
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_utc_time_change, async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    BACKLOG_MAX_VIDEOS,
     CONF_BACKLOG_PLAYLIST_URL,
     CONF_FEED_NAME,
     CONF_FEED_URL,
@@ -24,46 +29,230 @@ from .const import (
     CONF_RSS_FEEDS,
     DEFAULT_QUALITY,
     DOMAIN,
+    FEED_FETCH_CONCURRENCY,
+    FEED_MAX_BYTES,
+    FEEDPARSER_INLINE_MAX_BYTES,
+    GLOBAL_SEEN_FLUSH_SECONDS,
+    METUBE_POST_CONCURRENCY,
+    SEEN_MAX_URLS,
     STORAGE_KEY,
     STORAGE_VERSION,
+    STORE_SAVE_DELAY_SECONDS,
+)
+from .feed_links import (
+    FeedLinkParser,
+    YouTubeLinkScanner,
+    extract_links,
+    feedparser_links,
+    is_youtube_feed,
+    looks_like_html,
+    looks_like_xml,
+)
+from .seen import (
+    SeenUrls,
+    append_fingerprints,
+    unpack_fingerprints,
+    url_fingerprint,
 )
 
 _LOGGER = logging.getLogger(__name__)
 # Log at WARNING so it appears without logger config; confirms module was imported
 _LOGGER.warning("MeTube Manager: custom_components.metube_manager module loaded")
 
+# Default for every request on the entry session (immutable, shared by all requests)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# /add bodies are pre-encoded with orjson (shipped with HA core), so the type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Sent on every request via the entry session's default headers
+USER_AGENT = "MeTubeManager/1.0 (Home Assistant)"
+
+
+# yt-dlp options for flat playlist extraction (listing only, nothing is downloaded)
+_PLAYLIST_YDL_OPTS: dict[str, Any] = {
+    "extract_flat": "in_playlist",
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "youtube_include_dash_manifest": False,
+}
 
-def _yt_dlp_playlist_video_urls(playlist_url: str) -> list[str]:
-    """Extract all video watch URLs from a playlist using yt-dlp (flat, no download)."""
+
+def _yt_dlp_iter_playlist(playlist_url: str) -> Iterator[str]:
+    """Yield each playlist video's watch URL as yt-dlp pages through the playlist (flat, no download).
+
+    Stops after BACKLOG_MAX_VIDEOS URLs; extraction errors propagate to the caller.
+    """
     import yt_dlp
-    urls: list[str] = []
-    opts = {
-        "extract_flat": "in_playlist",
-        "quiet": True,
-        "no_warnings": True,
-    }
-    try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(playlist_url, download=False)
+
+    # A fresh instance per backlog (negligible next to the network time); the with block
+    # closes it, with its cookie jar and cache, once the generator finishes or is closed
+    with yt_dlp.YoutubeDL(_PLAYLIST_YDL_OPTS) as ydl:
+        # process=False keeps "entries" a lazy generator, so URLs come out page by page
+        info = ydl.extract_info(playlist_url, download=False, process=False)
+        if info and info.get("_type") in ("url", "url_transparent") and info.get("url"):
+            info = ydl.extract_info(info["url"], download=False, process=False)
         if not info:
-            return urls
-        entries = info.get("entries") or []
-        for entry in entries:
+            return
+        count = 0
+        for entry in info.get("entries") or []:
             if not entry:
                 continue
             vid_id = entry.get("id")
             if vid_id:
-                urls.append(f"https://www.youtube.com/watch?v={vid_id}")
+                yield f"https://www.youtube.com/watch?v={vid_id}"
             elif entry.get("url"):
-                urls.append(entry["url"])
+                yield entry["url"]
+            else:
+                continue
+            count += 1
+            if count >= BACKLOG_MAX_VIDEOS:
+                _LOGGER.warning(
+                    "yt-dlp playlist %s has more than %s videos, backlog stops there",
+                    playlist_url,
+                    BACKLOG_MAX_VIDEOS,
+                )
+                return
+
+
+def _drain_into_queue(
+    playlist_url: str,
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue[str | None],
+    stop: threading.Event,
+) -> None:
+    """Put the playlist's URLs on queue from an executor thread, then None.
+
+    The queue is bounded, so this thread waits while the consumer is behind; it gives up
+    as soon as stop is set (the consumer went away).
+    """
+
+    def _put(item: str | None) -> bool:
+        fut = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stop.is_set():
+            try:
+                fut.result(timeout=1)
+                return True
+            except TimeoutError:
+                continue
+        fut.cancel()
+        return False
+
+    urls = _yt_dlp_iter_playlist(playlist_url)
+    try:
+        for url in urls:
+            if not _put(url):
+                return
     except Exception as e:
         _LOGGER.warning("yt-dlp playlist extract failed for %s: %s", playlist_url, e)
-    return urls
+    finally:
+        # Closes the YoutubeDL on this thread, also when the consumer stopped early
+        urls.close()
+    _put(None)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole binary file; missing file reads as empty."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _seen_fingerprints_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Append-only file of seen-URL fingerprints (8 bytes each), next to the entry's Store file."""
+    return hass.config.path(".storage", f"{DOMAIN}_{entry_id}_{STORAGE_KEY}_fingerprints")
+
+
+def _global_seen_path(hass: HomeAssistant) -> str:
+    """Append-only file of fingerprints in the cross-entry seen index (see _global_seen_key)."""
+    return hass.config.path(".storage", f"{DOMAIN}_global_seen_fingerprints")
+
+
+def _global_seen_key(add_url: str | yarl.URL, quality: str, link: str) -> str:
+    """Cross-entry identity of a send: the same video to the same MeTube at the same quality."""
+    return f"{add_url}\n{quality}\n{link}"
+
+
+def _global_seen(hass: HomeAssistant) -> dict[str, Any]:
+    """Seen index shared by all entries: {"index": SeenUrls, "pending": [fingerprint], "flush_cancel", "in_flight"}.
+
+    It only short-circuits sends another entry already made; every entry still keeps its own
+    seen file, so the shared index can be dropped at any time without re-sending anything.
+    in_flight holds the keys whose POST is running right now, in any entry's poll.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    state = domain_data.get("global_seen")
+    if state is None:
+        state = {"index": SeenUrls(), "pending": [], "flush_cancel": None, "in_flight": set()}
+        domain_data["global_seen"] = state
+    return state
+
+
+def _global_seen_mark(hass: HomeAssistant, keys: Iterable[str]) -> None:
+    """Add keys to the shared index; they are written to disk in one batch within GLOBAL_SEEN_FLUSH_SECONDS."""
+    state = _global_seen(hass)
+    for key in keys:
+        fp = url_fingerprint(key)
+        state["index"].add_fingerprint(fp)
+        state["pending"].append(fp)
+    if state["pending"] and state["flush_cancel"] is None:
+        async def _flush(_now: Any) -> None:
+            state["flush_cancel"] = None
+            await _async_flush_global_seen(hass)
+        state["flush_cancel"] = async_call_later(hass, GLOBAL_SEEN_FLUSH_SECONDS, _flush)
+
+
+async def _async_flush_global_seen(hass: HomeAssistant) -> None:
+    """Append pending shared-index fingerprints to disk now."""
+    state = _global_seen(hass)
+    if state["flush_cancel"] is not None:
+        state["flush_cancel"]()
+        state["flush_cancel"] = None
+    pending, state["pending"] = state["pending"], []
+    if not pending:
+        return
+    try:
+        kept = await hass.async_add_executor_job(
+            append_fingerprints, _global_seen_path(hass), pending, SEEN_MAX_URLS
+        )
+        if kept is not None:
+            # Keys marked while the file was compacting are only in "pending"; keep them indexed
+            index = SeenUrls()
+            index.update_fingerprints(kept)
+            index.update_fingerprints(state["pending"])
+            state["index"] = index
+    except Exception as e:
+        _LOGGER.warning("Saving shared seen URLs failed: %s", e)
+
+
+async def _async_reset_global_seen(hass: HomeAssistant) -> None:
+    """Forget the shared index (memory and disk), e.g. when an entry's own history is cleared."""
+    state = _global_seen(hass)
+    if state["flush_cancel"] is not None:
+        state["flush_cancel"]()
+        state["flush_cancel"] = None
+    state["index"] = SeenUrls()
+    state["pending"] = []
+    await hass.async_add_executor_job(_remove_file, _global_seen_path(hass))
 
 
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the MeTube Manager domain."""
     _LOGGER.warning("MeTube Manager: async_setup (domain load) called")
+    try:
+        data = await hass.async_add_executor_job(_read_bytes, _global_seen_path(hass))
+        _global_seen(hass)["index"].update_fingerprints(unpack_fingerprints(data))
+    except Exception as e:
+        _LOGGER.warning("Loading shared seen URLs failed: %s", e)
     return True
 
 
@@ -85,6 +274,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Inner setup logic so we can catch exceptions in async_setup_entry."""
     store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_{entry.entry_id}_{STORAGE_KEY}")
+    seen_path = _seen_fingerprints_path(hass, entry.entry_id)
+    # Seen fingerprints are read from seen_path once on the first poll, then kept in memory
+    seen: SeenUrls | None = None
+    # Store payload as last loaded/saved; decoded from disk once, on the first poll
+    stored: dict[str, Any] | None = None
+    # True while a delayed Store write is scheduled (flushed on unload so a reload reads it back)
+    save_pending = False
+
+    async def _metube_flush_store() -> None:
+        nonlocal save_pending
+        if save_pending and stored is not None:
+            save_pending = False
+            await store.async_save(stored)
+
+    entry.async_on_unload(_metube_flush_store)
+
+    # Feeds whose body the XML parser rejected once; later polls hand them straight to feedparser
+    feedparser_feeds: set[str] = set()
 
     async def _metube_load_feed_stats() -> dict[str, Any]:
         """Load feed_stats from store for coordinator."""
@@ -98,16 +305,36 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
         update_method=_metube_load_feed_stats,
     )
     await coordinator.async_config_entry_first_refresh()
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    # One long-lived session per entry so RSS hosts and MeTube keep their pooled connections across polls
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=20, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75
+        ),
+        timeout=REQUEST_TIMEOUT,
+        headers={"User-Agent": USER_AGENT},
+    )
+    entry.async_on_unload(session.close)
+    entry_data: dict[str, Any] = {
+        "coordinator": coordinator,
+        "session": session,
+    }
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry_data
 
     def _metube_update_feed_stats(
         stats: dict[str, dict[str, Any]], feed_url: str, sent_count: int = 0
     ) -> None:
-        """Update feed_stats for a feed with last_fetched and total_sent."""
+        """Update feed_stats for a feed with last_fetched and total_sent (other fields are kept)."""
         now = datetime.now(timezone.utc).isoformat()
         prev = stats.get(feed_url) or {}
         total = (prev.get("total_sent") or 0) + sent_count
-        stats[feed_url] = {"last_fetched": now, "total_sent": total}
+        stats[feed_url] = {**prev, "last_fetched": now, "total_sent": total}
+
+    async def _metube_feedparser_links(body: bytes) -> list[str]:
+        """Extract links with feedparser: small bodies inline, larger ones in the executor."""
+        if len(body) <= FEEDPARSER_INLINE_MAX_BYTES:
+            return feedparser_links(body)
+        return await hass.async_add_executor_job(feedparser_links, body)
 
     def _metube_normalize_feed(f: Any) -> dict[str, Any] | None:
         """Return {url, name, backlog_playlist_url?} from feed item (dict or legacy string)."""
@@ -125,8 +352,25 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
             return {"url": f.strip(), "name": f.strip()}
         return None
 
-    async def _metube_poll_feeds(*_args: Any, **_kwargs: Any) -> None:
+    def _metube_store_settings(config_entry: ConfigEntry) -> None:
+        """Normalize feeds, base_url and quality from the entry into entry_data for the poll to read."""
+        options = config_entry.options or config_entry.data or {}
+        data = config_entry.data or {}
+        # Feeds can be in options (when set via create_entry) or in data (after options flow save)
+        raw_feeds = options.get(CONF_RSS_FEEDS) or data.get(CONF_RSS_FEEDS) or []
+        entry_data["raw_feed_count"] = len(raw_feeds)
+        entry_data["feeds"] = [f for f in (_metube_normalize_feed(x) for x in raw_feeds) if f]
+        entry_data["base_url"] = (options.get(CONF_METUBE_URL) or data.get(CONF_METUBE_URL) or "").rstrip("/")
+        # Parsed once here so aiohttp does not re-parse the string on every POST
+        entry_data["add_url"] = yarl.URL(entry_data["base_url"]) / "add" if entry_data["base_url"] else None
+        entry_data["quality"] = options.get(CONF_QUALITY) or data.get(CONF_QUALITY) or DEFAULT_QUALITY
+
+    # Settings only change through the options flow, which reloads the entry and so re-runs this
+    _metube_store_settings(entry)
+
+    async def _metube_run_poll() -> None:
         """Fetch all RSS feeds, find new video URLs, send to MeTube."""
+        nonlocal seen, stored, save_pending
         _LOGGER.warning("MeTube Manager: poll started for entry %s", entry.entry_id)
         try:
             # Use latest entry from config store (important for newly added entries)
@@ -134,13 +378,9 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
             if not current_entry:
                 _LOGGER.warning("MeTube Manager: config entry %s not found, skipping poll", entry.entry_id)
                 return
-            options = current_entry.options or current_entry.data or {}
-            data = current_entry.data or {}
-            # Feeds can be in options (when set via create_entry) or in data (after options flow save)
-            raw_feeds = options.get(CONF_RSS_FEEDS) or data.get(CONF_RSS_FEEDS) or []
-            feeds = [f for f in (_metube_normalize_feed(x) for x in raw_feeds) if f]
-            base_url = (options.get(CONF_METUBE_URL) or data.get(CONF_METUBE_URL) or "").rstrip("/")
-            quality = options.get(CONF_QUALITY) or data.get(CONF_QUALITY) or DEFAULT_QUALITY
+            feeds: list[dict[str, Any]] = entry_data["feeds"]
+            base_url: str = entry_data["base_url"]
+            quality: str = entry_data["quality"]
 
             if not base_url:
                 _LOGGER.warning("MeTube Manager: no MeTube URL configured, skipping poll")
@@ -148,26 +388,49 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
             if not feeds:
                 _LOGGER.warning(
                     "MeTube Manager: no feeds configured (raw_feeds=%s), skipping poll",
-                    len(raw_feeds),
+                    entry_data["raw_feed_count"],
                 )
                 return
 
             _LOGGER.debug("MeTube Manager: polling %s feed(s), base_url=%s", len(feeds), base_url)
 
+            # Only write storage when something changed: new URLs go to the append-only file,
+            # backlog/stats to the Store when a backlog completed or a video was sent
+            dirty_urls: list[str] = []
+            dirty_stats_changed = False
             try:
-                seen_data = await store.async_load() or {}
-                seen: set[str] = set(seen_data.get("urls", []) or [])
+                if stored is None:
+                    stored = await store.async_load() or {}
+                seen_data = stored
                 backlog_done: set[str] = set(seen_data.get("backlog_done", []) or [])
+                # {feed_url: {"last_fetched", "total_sent", "etag", "last_modified"}}; the last two
+                # are the HTTP validators sent back on the next conditional GET
                 feed_stats: dict[str, dict[str, Any]] = dict(seen_data.get("feed_stats") or {})
+                if seen is None:
+                    seen = SeenUrls()
+                    seen.update_fingerprints(
+                        unpack_fingerprints(await hass.async_add_executor_job(_read_bytes, seen_path))
+                    )
+                    # Migrate URLs older versions kept in the Store itself
+                    legacy_urls = [
+                        u for u in dict.fromkeys(seen_data.get("urls") or []) if u not in seen
+                    ]
+                    if legacy_urls:
+                        seen.update(legacy_urls)
+                        dirty_urls.extend(legacy_urls)
+                    if "urls" in seen_data:
+                        dirty_stats_changed = True
             except Exception as e:
                 _LOGGER.warning("Loading seen URLs failed: %s", e)
-                seen = set()
+                seen = SeenUrls()
+                stored = {}
                 backlog_done = set()
                 feed_stats = {}
+            backlog_done_before = set(backlog_done)
 
             # Prune data for removed channels (e.g. user edited config and removed a feed)
             current_feed_urls = {f["url"] for f in feeds}
-            removed_feed_urls = (set(feed_stats.keys()) | backlog_done) - current_feed_urls
+            removed_feed_urls = (set(feed_stats) | backlog_done) - current_feed_urls
             if removed_feed_urls:
                 _LOGGER.info(
                     "MeTube Manager: removing stored data for %s removed channel(s)",
@@ -175,265 +438,486 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
                 )
                 feed_stats = {k: v for k, v in feed_stats.items() if k in current_feed_urls}
                 backlog_done = backlog_done & current_feed_urls
-                seen = set()  # Clear seen URLs so removed channel's history is not kept
+                seen = SeenUrls()  # Clear seen URLs so removed channel's history is not kept
+                dirty_urls.clear()
                 try:
-                    await store.async_save({
-                        "urls": [],
+                    # The shared index may hold the same history; entries re-seed it as they send
+                    await _async_reset_global_seen(hass)
+                    await hass.async_add_executor_job(_remove_file, seen_path)
+                    payload = {
                         "backlog_done": list(backlog_done),
                         "feed_stats": feed_stats,
-                    })
+                    }
+                    await store.async_save(payload)
+                    stored = payload
+                    save_pending = False
                 except Exception as e:
                     _LOGGER.warning("MeTube Manager: failed to save pruned data: %s", e)
 
-            add_url = base_url.rstrip("/") + "/add"
+            add_url: yarl.URL = entry_data["add_url"]
             # Payload must match MeTube API: only "url" and "quality" (see README bookmarklet)
             def _metube_add_payload(link: str) -> dict[str, Any]:
                 return {"url": link, "quality": quality}
 
-            # Send one video at a time: one POST per URL, wait for response, then brief delay before next
+            # Shared-index keys for this poll are this prefix plus the link
+            global_key_prefix = _global_seen_key(add_url, quality, "")
+
+            def _metube_is_seen(link: str) -> bool:
+                """Sent before by this entry, or by any entry to the same MeTube at this quality."""
+                # The entry's own history answers most lookups, so it is checked first
+                return link in seen or (global_key_prefix + link) in _global_seen(hass)["index"]
+
+            # Each post worker sends one video at a time: one POST per URL, wait for the response,
+            # then a brief delay before its next one
             DELAY_BETWEEN_ADD_SECONDS = 1.0
 
-            async with aiohttp.ClientSession() as session:
-                for feed in feeds:
-                    feed_url = feed["url"]
-                    feed_name = feed.get("name") or feed_url
-                    backlog_playlist = (feed.get(CONF_BACKLOG_PLAYLIST_URL) or "").strip()
-
-                    # One-time backlog: generate URL from feed (YouTube playlist or RSS feed)
-                    backlog_sent = 0
-                    if not backlog_playlist:
-                        _LOGGER.debug("MeTube Manager: no backlog URL for %s, skipping backlog", feed_name)
-                    elif feed_url in backlog_done:
-                        _LOGGER.debug("MeTube Manager: backlog already done for %s, skipping", feed_name)
-                    else:
-                        _LOGGER.warning(
-                            "MeTube Manager: starting backlog fetch for %s (feed=%s)",
-                            feed_name,
-                            feed_url[:60] + "..." if len(feed_url) > 60 else feed_url,
-                        )
-                        if backlog_playlist == feed_url:
-                            # RSS backlog: fetch feed and send all current items once
-                            _LOGGER.warning("MeTube Manager: fetching RSS backlog for %s", feed_name)
-                            try:
-                                async with session.get(
-                                    feed_url,
-                                    timeout=aiohttp.ClientTimeout(total=30),
-                                    headers={"User-Agent": "MeTubeManager/1.0 (Home Assistant)"},
-                                ) as resp:
-                                    if resp.status != 200:
-                                        _LOGGER.warning(
-                                            "MeTube Manager: RSS backlog failed for %s - feed returned HTTP %s",
-                                            feed_name,
-                                            resp.status,
-                                        )
-                                        raise OSError(f"RSS returned {resp.status}")
-                                    text = await resp.text()
-                                parsed = await hass.async_add_executor_job(feedparser.parse, text)
-                                for item in getattr(parsed, "entries", []) or []:
-                                    link = (item.get("link") or "").strip()
-                                    if not link or link in seen:
-                                        continue
-                                    seen.add(link)
-                                    try:
-                                        async with session.post(
-                                            add_url,
-                                            json=_metube_add_payload(link),
-                                            timeout=aiohttp.ClientTimeout(total=30),
-                                        ) as add_resp:
-                                            body = await add_resp.text()
-                                            payload = _metube_add_payload(link)
-                                            _LOGGER.warning(
-                                                "MeTube /add (RSS backlog): payload=%s response_status=%s response_body=%s",
-                                                payload,
-                                                add_resp.status,
-                                                (body or "")[:500],
-                                            )
-                                            if add_resp.status in (200, 201):
-                                                backlog_sent += 1
-                                            else:
-                                                _LOGGER.warning(
-                                                    "MeTube /add failed for %s: %s %s",
-                                                    link,
-                                                    add_resp.status,
-                                                    body[:200],
-                                                )
-                                    except Exception as e:
-                                        _LOGGER.warning("MeTube /add failed for %s: %s", link, e)
-                                    await asyncio.sleep(DELAY_BETWEEN_ADD_SECONDS)
-                                backlog_done.add(feed_url)
-                                if backlog_sent:
-                                    _LOGGER.warning(
-                                        "MeTube Manager: sent %s video(s) from RSS backlog for %s",
-                                        backlog_sent,
-                                        feed_name,
-                                    )
-                                else:
-                                    _LOGGER.warning(
-                                        "MeTube Manager: RSS backlog for %s completed with 0 new videos sent",
-                                        feed_name,
-                                    )
-                            except Exception as e:
-                                _LOGGER.warning(
-                                    "MeTube Manager: RSS backlog failed for %s: %s",
-                                    feed_name,
-                                    e,
-                                )
-                                _LOGGER.exception("RSS backlog failed for %s: %s", feed_name, e)
-                        else:
-                            # YouTube playlist: fetch via yt-dlp
+            async def _metube_fetch_feed_links(
+                feed: dict[str, Any],
+                conditional: bool = True,
+            ) -> tuple[list[str] | None, dict[str, str] | None]:
+                """Fetch one RSS feed and extract its links.
+
+                Returns (links, validators); validators is the feed's new ETag/Last-Modified
+                pair, or None when it did not change. links is None when the fetch or parse failed.
+                conditional=False always downloads the full feed (used for the RSS backlog).
+                """
+                feed_url = feed["url"]
+                feed_name = feed.get("name") or feed_url
+                cached = feed_stats.get(feed_url) or {}
+                headers: dict[str, str] = {}  # User-Agent comes from the session defaults
+                if conditional and cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if conditional and cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+                try:
+                    async with session.get(
+                        feed_url,
+                        headers=headers,
+                    ) as resp:
+                        if resp.status == 304:
+                            _LOGGER.debug("MeTube Manager: feed %s not modified, skipping", feed_name)
+                            return ([], None)
+                        if resp.status != 200:
                             _LOGGER.warning(
-                                "MeTube Manager: fetching playlist backlog for %s (playlist=%s)",
+                                "RSS feed %s (%s) returned %s",
                                 feed_name,
-                                backlog_playlist[:60] + "..." if len(backlog_playlist) > 60 else backlog_playlist,
+                                feed_url,
+                                resp.status,
                             )
-                            try:
-                                playlist_urls = await hass.async_add_executor_job(
-                                    _yt_dlp_playlist_video_urls, backlog_playlist
-                                )
+                            return (None, None)
+                        # A feed URL that serves a web page (or something huge) is skipped after its
+                        # first chunk; chunked bodies are capped while streaming below. Some servers
+                        # label real feeds text/html, so that type alone does not reject the body
+                        content_type = resp.headers.get("Content-Type") or ""
+                        is_html = content_type.split(";", 1)[0].strip().lower() == "text/html"
+                        content_length = resp.headers.get("Content-Length")
+                        if (
+                            content_length
+                            and content_length.isdigit()
+                            and int(content_length) > FEED_MAX_BYTES
+                        ):
+                            _LOGGER.warning(
+                                "RSS feed %s (%s) is %s bytes, over the %s byte limit; skipping",
+                                feed_name,
+                                feed_url,
+                                content_length,
+                                FEED_MAX_BYTES,
+                            )
+                            return (None, None)
+                        # Stream the body into the link parser; the raw bytes are kept only for the fallback.
+                        # YouTube's own feeds skip XML parsing entirely (a regex finds each link).
+                        parser: FeedLinkParser | YouTubeLinkScanner | None = None
+                        if feed_url not in feedparser_feeds:
+                            parser = (
+                                YouTubeLinkScanner()
+                                if is_youtube_feed(feed_url)
+                                else FeedLinkParser()
+                            )
+                        buf = bytearray()
+                        async for chunk in resp.content.iter_chunked(64 * 1024):
+                            if not buf and is_html and looks_like_html(chunk):
                                 _LOGGER.warning(
-                                    "MeTube Manager: playlist backlog for %s got %s video URL(s) from yt-dlp",
+                                    "RSS feed %s (%s) returned %s, not a feed; skipping",
                                     feed_name,
-                                    len(playlist_urls),
+                                    feed_url,
+                                    content_type,
                                 )
-                                for link in playlist_urls:
-                                    if not link or link in seen:
-                                        continue
-                                    seen.add(link)
-                                    try:
-                                        async with session.post(
-                                            add_url,
-                                            json=_metube_add_payload(link),
-                                            timeout=aiohttp.ClientTimeout(total=30),
-                                        ) as add_resp:
-                                            body = await add_resp.text()
-                                            payload = _metube_add_payload(link)
-                                            _LOGGER.warning(
-                                                "MeTube /add (playlist backlog): payload=%s response_status=%s response_body=%s",
-                                                payload,
-                                                add_resp.status,
-                                                (body or "")[:500],
-                                            )
-                                            if add_resp.status in (200, 201):
-                                                backlog_sent += 1
-                                            else:
-                                                _LOGGER.warning(
-                                                    "MeTube /add failed for %s: %s %s",
-                                                    link,
-                                                    add_resp.status,
-                                                    body[:200],
-                                                )
-                                    except Exception as e:
-                                        _LOGGER.warning("MeTube /add request failed for %s: %s", link, e)
-                                    await asyncio.sleep(DELAY_BETWEEN_ADD_SECONDS)
-                                backlog_done.add(feed_url)
-                                if backlog_sent:
-                                    _LOGGER.warning(
-                                        "MeTube Manager: sent %s video(s) from playlist backlog for %s",
-                                        backlog_sent,
-                                        feed_name,
-                                    )
-                                else:
-                                    _LOGGER.warning(
-                                        "MeTube Manager: playlist backlog for %s completed with 0 new videos sent (had %s URLs from yt-dlp)",
-                                        feed_name,
-                                        len(playlist_urls),
-                                    )
-                            except Exception as e:
+                                return (None, None)
+                            if parser is not None and not buf and not looks_like_xml(chunk):
+                                parser = None
+                            buf += chunk
+                            if len(buf) > FEED_MAX_BYTES:
                                 _LOGGER.warning(
-                                    "MeTube Manager: playlist backlog failed for %s: %s",
+                                    "RSS feed %s (%s) is over the %s byte limit; skipping",
                                     feed_name,
-                                    e,
+                                    feed_url,
+                                    FEED_MAX_BYTES,
                                 )
-                                _LOGGER.exception("Backlog fetch failed for %s: %s", feed_name, e)
-                    _metube_update_feed_stats(feed_stats, feed_url, backlog_sent)
-
-                for feed in feeds:
-                    feed_url = feed["url"]
-                    feed_name = feed.get("name") or feed_url
-                    rss_sent = 0
-                    if not feed_url:
-                        continue
-                    try:
-                        resp = await session.get(
-                            feed_url,
-                            timeout=aiohttp.ClientTimeout(total=30),
-                            headers={"User-Agent": "MeTubeManager/1.0 (Home Assistant)"},
-                        )
-                        if resp.status != 200:
-                            _LOGGER.warning(
-                                "RSS feed %s (%s) returned %s",
-                                feed_name,
-                                feed_url,
-                                resp.status,
-                            )
-                            _metube_update_feed_stats(feed_stats, feed_url, 0)
-                            continue
-                        text = await resp.text()
-                    except Exception as e:
-                        _LOGGER.warning("Failed to fetch RSS %s (%s): %s", feed_name, feed_url, e)
-                        _metube_update_feed_stats(feed_stats, feed_url, 0)
-                        continue
+                                return (None, None)
+                            if parser is not None:
+                                try:
+                                    parser.feed(chunk)
+                                except ET.ParseError:
+                                    parser = None
+                        validators = {
+                            "etag": resp.headers.get("ETag") or "",
+                            "last_modified": resp.headers.get("Last-Modified") or "",
+                        }
+                except Exception as e:
+                    _LOGGER.warning("Failed to fetch RSS %s (%s): %s", feed_name, feed_url, e)
+                    return (None, None)
+                if validators == {k: cached.get(k) or "" for k in ("etag", "last_modified")}:
+                    validators = None
 
+                links: list[str] | None = None
+                if parser is not None:
+                    try:
+                        links = parser.close()
+                    except ET.ParseError:
+                        links = None
+                    if links is None and isinstance(parser, YouTubeLinkScanner):
+                        # YouTube changed its layout: the XML parser still handles it
+                        try:
+                            links = extract_links(bytes(buf))
+                        except ET.ParseError:
+                            links = None
+                if links is None:
+                    feedparser_feeds.add(feed_url)
+                    # Not well-formed XML: let feedparser recover what it can. The buffer is
+                    # released before parsing so only one copy of the body is alive meanwhile.
+                    body = bytes(buf)
+                    del buf
                     try:
-                        parsed = await hass.async_add_executor_job(feedparser.parse, text)
+                        links = await _metube_feedparser_links(body)
                     except Exception as e:
                         _LOGGER.warning("Failed to parse RSS %s (%s): %s", feed_name, feed_url, e)
-                        _metube_update_feed_stats(feed_stats, feed_url, 0)
-                        continue
+                        return (None, None)
+                return (links, validators)
 
-                    for item in getattr(parsed, "entries", []) or []:
-                        link = (item.get("link") or "").strip()
-                        if not link or link in seen:
-                            continue
-                        seen.add(link)
-
-                        try:
-                            async with session.post(
-                                add_url,
-                                json=_metube_add_payload(link),
-                                timeout=aiohttp.ClientTimeout(total=30),
-                            ) as add_resp:
-                                body = await add_resp.text()
-                                payload = _metube_add_payload(link)
-                                _LOGGER.warning(
-                                    "MeTube /add (RSS): payload=%s response_status=%s response_body=%s",
-                                    payload,
-                                    add_resp.status,
-                                    (body or "")[:500],
-                                )
-                                if add_resp.status in (200, 201):
-                                    rss_sent += 1
-                                else:
-                                    _LOGGER.warning(
-                                        "MeTube /add failed for %s: %s %s",
-                                        link,
-                                        add_resp.status,
-                                        body[:200],
-                                    )
-                        except Exception as e:
-                            _LOGGER.warning("MeTube /add request failed for %s: %s", link, e)
-                        await asyncio.sleep(DELAY_BETWEEN_ADD_SECONDS)
-                    if rss_sent:
-                        _LOGGER.info(
-                            "MeTube Manager: sent %s new video(s) from feed %s",
-                            rss_sent,
+            async def _metube_post_add(link: str, source: str) -> bool:
+                """POST one link to MeTube /add; True when MeTube accepted it."""
+                payload = _metube_add_payload(link)
+                try:
+                    async with session.post(
+                        add_url,
+                        data=orjson.dumps(payload),
+                        headers=JSON_HEADERS,
+                    ) as add_resp:
+                        body = await add_resp.text()
+                        _LOGGER.warning(
+                            "MeTube /add (%s): payload=%s response_status=%s response_body=%s",
+                            source,
+                            payload,
+                            add_resp.status,
+                            (body or "")[:500],
+                        )
+                        if add_resp.status in (200, 201):
+                            return True
+                        _LOGGER.warning(
+                            "MeTube /add failed for %s: %s %s",
+                            link,
+                            add_resp.status,
+                            body[:200],
+                        )
+                except Exception as e:
+                    _LOGGER.warning("MeTube /add request failed for %s: %s", link, e)
+                return False
+
+            # All POSTs (backlog and RSS) share one limit of METUBE_POST_CONCURRENCY at a time
+            post_semaphore = asyncio.Semaphore(METUBE_POST_CONCURRENCY)
+
+            async def _metube_post_bounded(link: str, source: str) -> bool:
+                async with post_semaphore:
+                    accepted = await _metube_post_add(link, source)
+                    await asyncio.sleep(DELAY_BETWEEN_ADD_SECONDS)
+                    return accepted
+
+            # Links handed to a POST this poll (in flight or done), and the ones MeTube accepted.
+            # Only accepted links become seen, so a failed POST is retried on the next poll.
+            queued: set[str] = set()
+            accepted: set[str] = set()
+
+            # Entries polling the same MeTube at the same time skip a link another one is sending
+            in_flight: set[str] = _global_seen(hass)["in_flight"]
+
+            async def _metube_send_accepted(link: str, source: str) -> bool:
+                key = global_key_prefix + link
+                if key in in_flight:
+                    return False
+                in_flight.add(key)
+                try:
+                    ok = await _metube_post_bounded(link, source)
+                    if ok:
+                        accepted.add(link)
+                        # Marked before leaving in_flight so the other entries never see a gap
+                        _global_seen_mark(hass, (key,))
+                finally:
+                    in_flight.discard(key)
+                return ok
+
+            async def _metube_send_backlog_queue(
+                url_q: asyncio.Queue[str | None], source: str
+            ) -> tuple[int, int, int]:
+                """Send links from url_q as they arrive until None; return (accepted, received, posted).
+
+                posted counts the links this call sent a POST for (not already seen or queued).
+
+                At most METUBE_POST_CONCURRENCY POSTs are in flight, so neither tasks nor queued
+                URLs pile up however long the playlist is.
+                """
+                pending: set[asyncio.Task[bool]] = set()
+                sent = 0
+                received = 0
+                posted = 0
+                while (link := await url_q.get()) is not None:
+                    received += 1
+                    if link in queued or _metube_is_seen(link):
+                        continue
+                    queued.add(link)
+                    posted += 1
+                    if len(pending) >= METUBE_POST_CONCURRENCY:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        sent += sum(not t.exception() and t.result() for t in done)
+                    pending.add(asyncio.create_task(_metube_send_accepted(link, source)))
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                return sent + sum(r is True for r in results), received, posted
+
+            async def _metube_playlist_backlog(
+                feed: dict[str, Any], backlog_playlist: str
+            ) -> tuple[int, bool]:
+                """Send a YouTube playlist's videos through yt-dlp once; return (accepted, completed)."""
+                feed_url = feed["url"]
+                feed_name = feed.get("name") or feed_url
+                _LOGGER.warning(
+                    "MeTube Manager: fetching playlist backlog for %s (playlist=%s)",
+                    feed_name,
+                    backlog_playlist[:60] + "..." if len(backlog_playlist) > 60 else backlog_playlist,
+                )
+                try:
+                    # yt-dlp feeds URLs in from its thread while earlier ones are already POSTing
+                    url_q: asyncio.Queue[str | None] = asyncio.Queue(maxsize=256)
+                    stop = threading.Event()
+                    extract = hass.async_add_executor_job(
+                        _drain_into_queue, backlog_playlist, hass.loop, url_q, stop
+                    )
+                    try:
+                        backlog_sent, playlist_count, backlog_posted = await _metube_send_backlog_queue(
+                            url_q, "playlist backlog"
+                        )
+                    finally:
+                        stop.set()
+                        await extract
+                    _LOGGER.warning(
+                        "MeTube Manager: playlist backlog for %s got %s video URL(s) from yt-dlp",
+                        feed_name,
+                        playlist_count,
+                    )
+                    if backlog_sent:
+                        _LOGGER.warning(
+                            "MeTube Manager: sent %s video(s) from playlist backlog for %s",
+                            backlog_sent,
+                            feed_name,
+                        )
+                    else:
+                        _LOGGER.warning(
+                            "MeTube Manager: playlist backlog for %s completed with 0 new videos sent (had %s URLs from yt-dlp)",
+                            feed_name,
+                            playlist_count,
+                        )
+                    if backlog_sent < backlog_posted:
+                        # Same rule as the RSS backlog: stays pending so the rejected videos are retried
+                        _LOGGER.warning(
+                            "MeTube Manager: %s of %s playlist backlog video(s) for %s were not accepted; retrying next poll",
+                            backlog_posted - backlog_sent,
+                            backlog_posted,
                             feed_name,
                         )
-                    _metube_update_feed_stats(feed_stats, feed_url, rss_sent)
+                        return (backlog_sent, False)
+                    return (backlog_sent, True)
+                except Exception as e:
+                    _LOGGER.warning(
+                        "MeTube Manager: playlist backlog failed for %s: %s",
+                        feed_name,
+                        e,
+                    )
+                    _LOGGER.exception("Backlog fetch failed for %s: %s", feed_name, e)
+                    return (0, False)
+
+            # One pass per feed: fetch workers run that feed's one-time backlog (if any), then
+            # stream-parse its RSS and queue new links; post workers send queued links to MeTube,
+            # so POSTs start while other feeds are still downloading
+            feed_q: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+            post_q: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=64)
+            for feed in feeds:
+                feed_q.put_nowait(feed)
+            # Per feed: RSS links queued for posting, and how many of those MeTube accepted
+            rss_queued: dict[str, int] = {f["url"]: 0 for f in feeds}
+            rss_sent: dict[str, int] = {f["url"]: 0 for f in feeds}
+            # feed_url -> (backlog videos accepted, playlist backlog completed, RSS backlog fetched,
+            # new HTTP validators or None)
+            feed_results: dict[str, tuple[int, bool, bool, dict[str, str] | None]] = {}
+
+            async def _metube_process_feed(
+                feed: dict[str, Any]
+            ) -> tuple[int, bool, bool, dict[str, str] | None]:
+                """Run one feed's backlog (if due) and RSS fetch, queueing its new links for posting.
+
+                Persistent state (backlog_done, feed_stats) is not touched here; the caller merges
+                the returned result once every feed has finished.
+                """
+                feed_url = feed["url"]
+                feed_name = feed.get("name") or feed_url
+                backlog_playlist = (feed.get(CONF_BACKLOG_PLAYLIST_URL) or "").strip()
+
+                # One-time backlog: a YouTube playlist via yt-dlp, or the RSS feed itself
+                backlog_sent, backlog_completed, rss_backlog = 0, False, False
+                if not backlog_playlist:
+                    _LOGGER.debug("MeTube Manager: no backlog URL for %s, skipping backlog", feed_name)
+                elif feed_url in backlog_done:
+                    _LOGGER.debug("MeTube Manager: backlog already done for %s, skipping", feed_name)
+                else:
+                    _LOGGER.warning(
+                        "MeTube Manager: starting backlog fetch for %s (feed=%s)",
+                        feed_name,
+                        feed_url[:60] + "..." if len(feed_url) > 60 else feed_url,
+                    )
+                    if backlog_playlist == feed_url:
+                        # RSS backlog: the full (unconditional) fetch below sends all current items
+                        _LOGGER.warning("MeTube Manager: fetching RSS backlog for %s", feed_name)
+                        rss_backlog = True
+                    else:
+                        backlog_sent, backlog_completed = await _metube_playlist_backlog(
+                            feed, backlog_playlist
+                        )
+
+                async def _metube_enqueue(link: str) -> None:
+                    if link in queued or _metube_is_seen(link):
+                        return
+                    queued.add(link)
+                    rss_queued[feed_url] += 1
+                    await post_q.put((feed_url, link))
+
+                # Links are queued only after the body is fully read: waiting on a full post_q
+                # mid-stream would stall the download while REQUEST_TIMEOUT keeps running
+                links, validators = await _metube_fetch_feed_links(feed, conditional=not rss_backlog)
+                if links is None:
+                    if rss_backlog:
+                        _LOGGER.warning("MeTube Manager: RSS backlog failed for %s", feed_name)
+                    return (backlog_sent, backlog_completed, False, None)
+                for link in links:
+                    await _metube_enqueue(link)
+                return (backlog_sent, backlog_completed, rss_backlog, validators)
+
+            async def _metube_fetch_worker() -> None:
+                while not feed_q.empty():
+                    feed = feed_q.get_nowait()
+                    try:
+                        feed_results[feed["url"]] = await _metube_process_feed(feed)
+                    except Exception as e:
+                        # One broken feed must not stop this worker from draining the others
+                        _LOGGER.warning(
+                            "MeTube Manager: processing feed %s failed: %s",
+                            feed.get("name") or feed["url"],
+                            e,
+                        )
 
+            async def _metube_post_worker() -> None:
+                while (job := await post_q.get()) is not None:
+                    feed_url, link = job
+                    if await _metube_send_accepted(link, "RSS"):
+                        rss_sent[feed_url] += 1
+
+            post_workers = [
+                asyncio.create_task(_metube_post_worker()) for _ in range(METUBE_POST_CONCURRENCY)
+            ]
             try:
-                await store.async_save({
-                    "urls": list(seen),
-                    "backlog_done": list(backlog_done),
+                await asyncio.gather(
+                    *(_metube_fetch_worker() for _ in range(min(FEED_FETCH_CONCURRENCY, len(feeds)))),
+                    return_exceptions=True,
+                )
+            finally:
+                for _ in post_workers:
+                    await post_q.put(None)
+                await asyncio.gather(*post_workers, return_exceptions=True)
+
+            # Merge pipeline results into the persistent state once all workers are done
+            seen.update(accepted)
+            dirty_urls.extend(accepted)
+            backlog_sent: dict[str, int] = {}
+            for feed_url, (sent, completed, rss_backlog, validators) in feed_results.items():
+                backlog_sent[feed_url] = sent
+                # If any of the feed's links was not accepted, keep the old ETag/Last-Modified
+                # (a 304 next poll would hide the failed links) and leave an RSS backlog pending
+                rss_all_accepted = rss_sent[feed_url] == rss_queued[feed_url]
+                if not rss_all_accepted:
+                    _LOGGER.warning(
+                        "MeTube Manager: %s of %s new link(s) from feed %s were not accepted; retrying next poll",
+                        rss_queued[feed_url] - rss_sent[feed_url],
+                        rss_queued[feed_url],
+                        feed_url,
+                    )
+                if completed or (rss_backlog and rss_all_accepted):
+                    backlog_done.add(feed_url)
+                if validators is not None and rss_all_accepted:
+                    feed_stats[feed_url] = {**(feed_stats.get(feed_url) or {}), **validators}
+                    dirty_stats_changed = True
+            for feed in feeds:
+                sent = rss_sent[feed["url"]]
+                if sent:
+                    _LOGGER.info(
+                        "MeTube Manager: sent %s new video(s) from feed %s",
+                        sent,
+                        feed.get("name") or feed["url"],
+                    )
+                total = backlog_sent.get(feed["url"], 0) + sent
+                if total:
+                    dirty_stats_changed = True
+                _metube_update_feed_stats(feed_stats, feed["url"], total)
+
+            if dirty_urls:
+                try:
+                    kept = await hass.async_add_executor_job(
+                        append_fingerprints,
+                        seen_path,
+                        [url_fingerprint(u) for u in dirty_urls],
+                        SEEN_MAX_URLS,
+                    )
+                    if kept is not None:
+                        # History was compacted on disk; rebuild the index so memory stays bounded too
+                        seen = SeenUrls()
+                        seen.update_fingerprints(kept)
+                except Exception as e:
+                    _LOGGER.warning("Saving seen URLs failed: %s", e)
+            if dirty_stats_changed or backlog_done != backlog_done_before:
+                # Persist state for the current feeds only, so removed feeds never grow the Store
+                feed_stats = {k: v for k, v in feed_stats.items() if k in current_feed_urls}
+                payload = {
+                    "backlog_done": [u for u in backlog_done if u in current_feed_urls],
                     "feed_stats": feed_stats,
-                })
-            except Exception as e:
-                _LOGGER.warning("Saving seen URLs failed: %s", e)
+                }
+                # Write-behind: polls within STORE_SAVE_DELAY_SECONDS share one write (HA also
+                # flushes pending delayed saves when it stops)
+                store.async_delay_save(lambda: payload, STORE_SAVE_DELAY_SECONDS)
+                stored = payload
+                save_pending = True
             coordinator.async_set_updated_data(feed_stats)
 
         except Exception as e:
             _LOGGER.exception("MeTube Manager: poll failed: %s", e)
 
+    # A long backlog can outlast the hourly trigger; never run two polls over the same state at once
+    poll_lock = asyncio.Lock()
+
+    async def _metube_poll_feeds(*_args: Any, **_kwargs: Any) -> None:
+        if poll_lock.locked():
+            _LOGGER.warning(
+                "MeTube Manager: previous poll for entry %s still running, skipping this one",
+                entry.entry_id,
+            )
+            return
+        async with poll_lock:
+            await _metube_run_poll()
+
     # Run once after a short delay (so new entry options are committed), then at the top of every hour
     async def _metube_first_poll(_now: Any) -> None:
         await _metube_poll_feeds()
@@ -459,7 +943,17 @@ async def _metube_setup_entry_impl(hass: HomeAssistant, entry: ConfigEntry) -> N
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry; remove interval listener and sensors."""
-    hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.pop(entry.entry_id, None)
+    # With the last entry: write out the shared seen index. Counted from the loaded entries, so
+    # shared keys in hass.data[DOMAIN] never need listing here (this entry is already unloading)
+    remaining = [
+        e
+        for e in hass.config_entries.async_entries(DOMAIN)
+        if e.state is ConfigEntryState.LOADED and e.entry_id != entry.entry_id
+    ]
+    if not remaining and "global_seen" in domain_data:
+        await _async_flush_global_seen(hass)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     return unload_ok
 
@@ -468,6 +962,8 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry and delete all stored data (seen URLs, backlog state, feed_stats)."""
     store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_{entry.entry_id}_{STORAGE_KEY}")
     await store.async_remove()
+    await hass.async_add_executor_job(_remove_file, _seen_fingerprints_path(hass, entry.entry_id))
+    await _async_reset_global_seen(hass)
     _LOGGER.info(
         "MeTube Manager: removed all stored data for deleted entry %s (channel data cleared)",
         entry.entry_id,
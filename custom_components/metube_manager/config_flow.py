@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
+import html
 import re
 from typing import Any
 
@@ -12,6 +15,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_BACKLOG_PLAYLIST_URL,
@@ -25,7 +29,9 @@ from .const import (
     CONF_RSS_FEEDS,
     DEFAULT_QUALITY,
     DOMAIN,
-    QUALITY_OPTIONS,
+    FEED_FETCH_TIMEOUT_SECONDS,
+    QUALITY_VALUE_LIST,
+    QUALITY_VALUES,
     YOUTUBE_FEED_ALL,
     YOUTUBE_FEED_VIDEOS,
     YOUTUBE_FEED_SHORTS,
@@ -33,30 +39,64 @@ from .const import (
     YOUTUBE_FEED_TYPES,
 )
 
-
+# Connection test timeout (immutable, shared by every check)
+CONNECTION_TEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# Channel feed fetch timeout; a feed can be slower to start than the MeTube reachability check
+FEED_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=FEED_FETCH_TIMEOUT_SECONDS)
+# Any of these final statuses (after redirects) means something answered at the MeTube URL
+_REACHABLE_STATUSES = frozenset({200, 204, 405})
+# Quality selector shared by the user and options schemas (stateless)
+_QUALITY_IN = vol.In(QUALITY_VALUE_LIST)
+# Playlist ID prefix per feed type (Videos=UULF, Shorts=UUSH, Live=UULV), put before channel_id[2:]
+_YT_PLAYLIST_PREFIX: dict[str, str] = {
+    YOUTUBE_FEED_VIDEOS: "UULF",
+    YOUTUBE_FEED_SHORTS: "UUSH",
+    YOUTUBE_FEED_LIVE: "UULV",
+}
+# Resolved (channel_id, channel_title) by normalized channel URL, kept for the life of the process
+_CHANNEL_CACHE: dict[str, tuple[str, str]] = {}
+_CHANNEL_CACHE_SIZE = 512
+# Channel ID in a /channel/ URL: such inputs need no yt-dlp lookup
+_CHANNEL_ID_RE = re.compile(r"youtube\.com/channel/(UC[A-Za-z0-9_-]{20,})")
+# Channel title: the feed's first <title>, which comes before any entry
+_FEED_TITLE_RE = re.compile(rb"<title>([^<]{1,200})</title>")
+
+
+@lru_cache(maxsize=256)
 def _normalize_url(url: str) -> str:
     """Strip trailing slash and ensure scheme."""
+    # Stored URLs are already normalized: hand them back untouched
+    if url and url.startswith(("http://", "https://")) and url[-1] != "/" and url == url.strip():
+        return url
     url = (url or "").strip()
     if url and not url.startswith(("http://", "https://")):
         url = "http://" + url
     return url.rstrip("/")
 
 
+@lru_cache(maxsize=256)
 def _normalize_channel_name(s: str) -> str:
     """Strip and collapse multiple spaces so channel names don't get extra spaces."""
     return " ".join((s or "").strip().split())
 
 
-def _validate_metube_url(url: str) -> bool:
-    """Validate MeTube base URL."""
-    try:
-        normalized = _normalize_url(url)
-        if not normalized:
-            return False
-        # Basic URL check
-        return bool(re.match(r"^https?://[^/]+", normalized))
-    except Exception:
-        return False
+def _normalized_metube_url(url: str) -> str | None:
+    """Normalized MeTube base URL, or None when it is not a valid http(s) URL."""
+    normalized = _normalize_url(url)
+    # Scheme plus a host: at least one character after "://" that is not "/"
+    if normalized.startswith("https://"):
+        return normalized if normalized[8:9] not in ("", "/") else None
+    if normalized.startswith("http://"):
+        return normalized if normalized[7:8] not in ("", "/") else None
+    return None
+
+
+def _playlist_id(channel_id: str, feed_type: str) -> str:
+    """Playlist ID for a channel's feed type: type prefix + channel_id without leading "UC" (All = UU)."""
+    if len(channel_id) <= 2:
+        return channel_id
+    prefix = "UU" if feed_type == YOUTUBE_FEED_ALL else _YT_PLAYLIST_PREFIX.get(feed_type, "UULF")
+    return prefix + channel_id[2:]
 
 
 def _youtube_feed_url(channel_id: str, feed_type: str) -> str:
@@ -66,14 +106,7 @@ def _youtube_feed_url(channel_id: str, feed_type: str) -> str:
         feed_type = YOUTUBE_FEED_ALL
     if feed_type == YOUTUBE_FEED_ALL:
         return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    # Playlist IDs: Videos=UULF, Shorts=UUSH, Live=UULV + channel_id without leading "UC"
-    prefix = {
-        YOUTUBE_FEED_VIDEOS: "UULF",
-        YOUTUBE_FEED_SHORTS: "UUSH",
-        YOUTUBE_FEED_LIVE: "UULV",
-    }.get(feed_type, "UULF")
-    playlist_id = prefix + channel_id[2:] if len(channel_id) > 2 else channel_id
-    return f"https://www.youtube.com/feeds/videos.xml?playlist_id={playlist_id}"
+    return f"https://www.youtube.com/feeds/videos.xml?playlist_id={_playlist_id(channel_id, feed_type)}"
 
 
 def _youtube_backlog_playlist_url(channel_id: str, feed_type: str) -> str:
@@ -82,42 +115,7 @@ def _youtube_backlog_playlist_url(channel_id: str, feed_type: str) -> str:
     if feed_type not in YOUTUBE_FEED_TYPES:
         feed_type = YOUTUBE_FEED_ALL
     # All = uploads playlist UU+channel_id[2:]; Videos/Shorts/Live = same as feed playlist
-    if feed_type == YOUTUBE_FEED_ALL:
-        prefix = "UU"
-    else:
-        prefix = {
-            YOUTUBE_FEED_VIDEOS: "UULF",
-            YOUTUBE_FEED_SHORTS: "UUSH",
-            YOUTUBE_FEED_LIVE: "UULV",
-        }.get(feed_type, "UULF")
-    playlist_id = prefix + channel_id[2:] if len(channel_id) > 2 else channel_id
-    return f"https://www.youtube.com/playlist?list={playlist_id}"
-
-
-def _is_backlog_checkbox(val: str) -> bool:
-    """True if the third column is a backlog checkbox (not a custom URL)."""
-    v = (val or "").strip().lower()
-    return v in ("backlog", "yes", "1", "true", "on")
-
-
-def _is_youtube_feed_type(s: str) -> bool:
-    """True if s is a known YouTube feed type (All, Videos, Shorts, Live)."""
-    return (s or "").strip().lower() in YOUTUBE_FEED_TYPES
-
-
-def _looks_like_youtube_channel(s: str) -> bool:
-    """True if s looks like a YouTube channel reference (URL or @handle)."""
-    s = (s or "").strip()
-    if not s:
-        return False
-    if s.startswith("@"):
-        return True
-    s_lower = s.lower()
-    return (
-        "youtube.com/channel/" in s_lower
-        or "youtube.com/@" in s_lower
-        or "youtu.be/" in s_lower
-    )
+    return f"https://www.youtube.com/playlist?list={_playlist_id(channel_id, feed_type)}"
 
 
 def _normalize_youtube_channel_input(s: str) -> str:
@@ -125,7 +123,7 @@ def _normalize_youtube_channel_input(s: str) -> str:
     s = (s or "").strip()
     if not s:
         return ""
-    if s.startswith("http://") or s.startswith("https://"):
+    if s.startswith(("http://", "https://")):
         url = s
         if "/videos" not in url and "/channel/" not in url and "/@" in url:
             url = url.rstrip("/") + "/videos"
@@ -135,137 +133,142 @@ def _normalize_youtube_channel_input(s: str) -> str:
     return f"https://www.youtube.com/@{s}/videos"
 
 
-def _resolve_youtube_channel_sync(url: str) -> tuple[str, str] | None:
-    """Resolve YouTube channel URL to (channel_id, channel_title). Runs in executor."""
+def _channel_from_info(info: dict[str, Any] | None) -> tuple[str, str] | None:
+    """(channel_id, channel_title) from a yt-dlp channel page info dict."""
+    if not info:
+        return None
+    channel_id = (
+        info.get("channel_id")
+        or info.get("id")
+        or (info.get("uploader_id") if info.get("channel") else None)
+    )
+    if not channel_id and info.get("entries"):
+        first = info["entries"][0]
+        if isinstance(first, dict):
+            channel_id = first.get("channel_id") or first.get("uploader_id")
+    raw_title = (
+        (info.get("channel") or info.get("uploader") or info.get("title") or "")
+    ).strip()
+    title = _normalize_channel_name(raw_title)
+    if channel_id and len(channel_id) >= 2:
+        return (str(channel_id), title or channel_id)
+    return None
+
+
+def _resolve_youtube_channels_sync(urls: list[str]) -> list[tuple[str, str] | None]:
+    """Resolve YouTube channel URLs to (channel_id, channel_title), None where that fails. Runs in executor.
+
+    One YoutubeDL serves every URL, so yt-dlp and its extractors are set up once per batch.
+    """
     import yt_dlp
+    # Metadata only: no format checks or downloads, one retry, and a short socket timeout
+    # since the flow waits on this
     opts = {
         "quiet": True,
         "no_warnings": True,
         "extract_flat": "in_playlist",
+        "skip_download": True,
+        "check_formats": False,
+        "noplaylist": True,
+        "ignoreerrors": True,
+        "extractor_retries": 1,
+        "socket_timeout": 8,
+        "playlist_items": "1",
     }
+    results: list[tuple[str, str] | None] = []
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        for url in urls:
+            try:
+                info = ydl.extract_info(url, download=False, process=False)
+                results.append(_channel_from_info(info))
+            except Exception:
+                results.append(None)
+    return results
+
+
+async def _resolve_channel_id_via_feed(
+    hass: HomeAssistant, channel_id: str
+) -> tuple[str, str] | None:
+    """(channel_id, channel_title) for a known channel ID, with the title read from its RSS feed head."""
+    session = async_get_clientsession(hass)
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False, process=False)
-        if not info:
-            return None
-        channel_id = (
-            info.get("channel_id")
-            or info.get("id")
-            or (info.get("uploader_id") if info.get("channel") else None)
-        )
-        if not channel_id and info.get("entries"):
-            first = info["entries"][0]
-            if isinstance(first, dict):
-                channel_id = first.get("channel_id") or first.get("uploader_id")
-        raw_title = (
-            (info.get("channel") or info.get("uploader") or info.get("title") or "")
-        ).strip()
-        title = _normalize_channel_name(raw_title)
-        if channel_id and len(channel_id) >= 2:
-            return (str(channel_id), title or channel_id)
+        async with session.get(
+            _youtube_feed_url(channel_id, YOUTUBE_FEED_ALL), timeout=FEED_FETCH_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                return None
+            head = b""
+            async for chunk in resp.content.iter_chunked(4096):
+                head += chunk
+                if (match := _FEED_TITLE_RE.search(head)) is not None:
+                    raw_title = html.unescape(match.group(1).decode("utf-8", "replace"))
+                    title = _normalize_channel_name(raw_title)
+                    return (channel_id, title or channel_id)
+                if len(head) > 16384:
+                    break
     except Exception:
-        pass
+        return None
     return None
 
 
-async def _resolve_youtube_channel(hass: HomeAssistant, channel_input: str) -> tuple[str, str] | None:
-    """Resolve YouTube channel URL or @handle to (channel_id, channel_title)."""
-    url = _normalize_youtube_channel_input(channel_input)
-    if not url:
-        return None
-    return await hass.async_add_executor_job(_resolve_youtube_channel_sync, url)
-
+def _cache_channel(url: str, channel: tuple[str, str]) -> None:
+    """Remember a resolved channel, dropping the oldest entry once the cache is full."""
+    if len(_CHANNEL_CACHE) >= _CHANNEL_CACHE_SIZE:
+        del _CHANNEL_CACHE[next(iter(_CHANNEL_CACHE))]
+    _CHANNEL_CACHE[url] = channel
 
-def _line_contains_url(line: str) -> bool:
-    """True if the line contains an http(s) URL (we only allow channel names, not manual RSS)."""
-    return "http://" in line or "https://" in line
 
+async def _resolve_youtube_channels(
+    hass: HomeAssistant, channel_inputs: list[str]
+) -> list[tuple[str, str] | None]:
+    """Resolve YouTube channel URLs or @handles to (channel_id, channel_title) in one executor job.
 
-def _parse_feeds_text_lines(raw: str) -> list[tuple[bool, str, str, str]]:
-    """Parse lines into (is_youtube, channel_ref, feed_type, backlog). Only YouTube channel names allowed.
-    Format: channel_name   or   channel_name | backlog   or   channel_name | feed_type | backlog
-    Default feed type is Videos. Lines containing URLs are skipped (channel names only).
+    Channels resolved before (in any flow) are answered from _CHANNEL_CACHE without yt-dlp.
+    /channel/UC... URLs already carry the ID; only their title is read, from the RSS feed.
     """
-    out: list[tuple[bool, str, str, str]] = []
-    default_feed_type = YOUTUBE_FEED_VIDEOS
-    for line in (raw or "").strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if _line_contains_url(line):
-            continue
-        parts = [p.strip() for p in line.split(" | ")]
-        first = parts[0] if parts else ""
-        second = parts[1] if len(parts) > 1 else ""
-        third = " | ".join(parts[2:]).strip() if len(parts) > 2 else ""
-
-        if not first:
-            continue
-
-        # 1 part: channel name only
-        if len(parts) == 1:
-            out.append((True, first, default_feed_type, ""))
-            continue
-
-        # 2 parts: channel | backlog  or  channel | feed_type
-        if len(parts) == 2:
-            if _is_youtube_feed_type(second):
-                out.append((True, first, second, ""))
-            elif _is_backlog_checkbox(second):
-                out.append((True, first, default_feed_type, second))
-            else:
-                out.append((True, first, default_feed_type, ""))
-            continue
+    if not channel_inputs:
+        return []
+    urls = [_normalize_youtube_channel_input(c) for c in channel_inputs]
+    to_resolve = [u for u in dict.fromkeys(urls) if u and u not in _CHANNEL_CACHE]
+    by_id = {u: m.group(1) for u in to_resolve if (m := _CHANNEL_ID_RE.search(u))}
+    if by_id:
+        fast = await asyncio.gather(
+            *(_resolve_channel_id_via_feed(hass, cid) for cid in by_id.values())
+        )
+        for url, channel in zip(by_id, fast):
+            if channel is not None:
+                _cache_channel(url, channel)
+        to_resolve = [u for u in to_resolve if u not in _CHANNEL_CACHE]
+    if to_resolve:
+        try:
+            resolved = await hass.async_add_executor_job(_resolve_youtube_channels_sync, to_resolve)
+        except Exception:
+            resolved = [None] * len(to_resolve)
+        for url, channel in zip(to_resolve, resolved):
+            # Failures are not cached, so a transient error is retried on the next lookup
+            if channel is not None:
+                _cache_channel(url, channel)
+    return [_CHANNEL_CACHE.get(u) if u else None for u in urls]
 
-        # 3+ parts: channel | feed_type | backlog
-        if _is_youtube_feed_type(second):
-            out.append((True, first, second, third))
-        else:
-            out.append((True, first, default_feed_type, third))
-    return out
-
-
-async def _parse_feeds_text_and_fetch_names(
-    hass: HomeAssistant,
-    raw: str,
-    existing_url_to_name: dict[str, str] | None = None,
-    existing_url_to_backlog: dict[str, str] | None = None,
-) -> list[dict[str, Any]]:
-    """Parse feed lines: YouTube channel names only (no backlog in text; backlog set by checkbox in UI).
-    Resolves each channel to channel_id and builds feed URLs; backlog comes from existing or step 2."""
-    existing_backlog = existing_url_to_backlog or {}
-    lines = _parse_feeds_text_lines(raw)
-    result: list[dict[str, Any]] = []
-    for _is_youtube, part1, part2, _backlog_ignored in lines:
-        resolved = await _resolve_youtube_channel(hass, part1)
-        if not resolved:
-            continue
-        channel_id, channel_name = resolved
-        feed_type = (part2 or YOUTUBE_FEED_VIDEOS).lower().strip()
-        if feed_type not in YOUTUBE_FEED_TYPES:
-            feed_type = YOUTUBE_FEED_VIDEOS
-        rss_url = _youtube_feed_url(channel_id, feed_type)
-        display_name = _normalize_channel_name(channel_name or part1)
-        backlog_url = existing_backlog.get(rss_url, "")
-        result.append({
-            CONF_FEED_URL: rss_url,
-            CONF_FEED_NAME: display_name,
-            CONF_BACKLOG_PLAYLIST_URL: backlog_url,
-            CONF_CHANNEL_ID: channel_id,
-            "_feed_type": feed_type,
-        })
-    return result
+
+async def _resolve_youtube_channel(hass: HomeAssistant, channel_input: str) -> tuple[str, str] | None:
+    """Resolve YouTube channel URL or @handle to (channel_id, channel_title)."""
+    return (await _resolve_youtube_channels(hass, [channel_input]))[0]
 
 
 async def _test_metube_connection(hass: HomeAssistant, base_url: str) -> bool:
     """Test that we can reach MeTube (optional: GET / or /add might return 405 which is ok)."""
-    import aiohttp
-    base_url = _normalize_url(base_url)
+    # Callers pass a URL that _normalized_metube_url already accepted
+    # HA's shared session keeps its pooled connections instead of a new pool per check
+    session = async_get_clientsession(hass)
     try:
-        async with aiohttp.ClientSession() as session:
-            # MeTube might not have a root that returns 200; /add with GET may 405. Just check reachability.
-            async with session.get(base_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                return resp.status in (200, 405)
+        # HEAD: only reachability matters, so MeTube's web UI bundle is never downloaded.
+        # A server without HEAD support answers 405, which still proves it is there.
+        # Redirects (e.g. a proxy's http -> https 301/307/308) are followed; the final answer counts.
+        async with session.head(
+            base_url, allow_redirects=True, timeout=CONNECTION_TEST_TIMEOUT
+        ) as resp:
+            return resp.status in _REACHABLE_STATUSES
     except Exception:
         return False
 
@@ -295,7 +298,7 @@ class MeTubeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not url:
             url = "http://localhost:8081"
         quality = opts.get(CONF_QUALITY) or data.get(CONF_QUALITY) or DEFAULT_QUALITY
-        if quality not in [v for v, _ in QUALITY_OPTIONS]:
+        if quality not in QUALITY_VALUES:
             quality = DEFAULT_QUALITY
         return (url, quality)
 
@@ -306,8 +309,8 @@ class MeTubeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         default_url, default_quality = self._default_url_and_quality()
         if user_input is not None:
-            url = _normalize_url(user_input.get(CONF_METUBE_URL, ""))
-            if not _validate_metube_url(url):
+            url = _normalized_metube_url(user_input.get(CONF_METUBE_URL, ""))
+            if url is None:
                 errors["base"] = "invalid_url"
             else:
                 ok = await _test_metube_connection(self.hass, url)
@@ -351,9 +354,7 @@ class MeTubeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_METUBE_URL, default=default_url): str,
-                vol.Required(CONF_QUALITY, default=default_quality): vol.In(
-                    [v for v, _ in QUALITY_OPTIONS]
-                ),
+                vol.Required(CONF_QUALITY, default=default_quality): _QUALITY_IN,
                 vol.Required(CONF_CHANNEL_NAME, default=""): str,
                 vol.Required(CONF_FETCH_BACKLOG, default=False): cv.boolean,
             }
@@ -400,16 +401,13 @@ class MeTubeManagerOptionsFlow(config_entries.OptionsFlow):
             return self.async_abort(reason="config_entry_not_found")
         errors: dict[str, str] = {}
         if user_input is not None:
-            url = _normalize_url(user_input.get(CONF_METUBE_URL, ""))
-            if not _validate_metube_url(url):
+            url = _normalized_metube_url(user_input.get(CONF_METUBE_URL, ""))
+            if url is None:
                 return self.async_show_form(
                     step_id="init",
                     data_schema=self._schema(user_input),
                     errors={"base": "invalid_url"},
                 )
-            ok = await _test_metube_connection(self.hass, url)
-            if not ok:
-                pass
             channel_name = (user_input.get(CONF_CHANNEL_NAME) or "").strip()
             if not channel_name:
                 return self.async_show_form(
@@ -417,7 +415,15 @@ class MeTubeManagerOptionsFlow(config_entries.OptionsFlow):
                     data_schema=self._schema(user_input),
                     errors={"base": "invalid_feed"},
                 )
-            resolved = await _resolve_youtube_channel(self.hass, channel_name)
+            current = self._current_single_feed() or {}
+            if (
+                current.get(CONF_CHANNEL_ID)
+                and _normalize_channel_name(current.get(CONF_FEED_NAME) or "") == channel_name
+            ):
+                # Channel left as it was: keep its resolved ID instead of asking yt-dlp again
+                resolved = (current[CONF_CHANNEL_ID], channel_name)
+            else:
+                resolved = await _resolve_youtube_channel(self.hass, channel_name)
             if not resolved:
                 return self.async_show_form(
                     step_id="init",
@@ -479,13 +485,12 @@ class MeTubeManagerOptionsFlow(config_entries.OptionsFlow):
             quality = user_input.get(CONF_QUALITY) or quality
             channel_name = (user_input.get(CONF_CHANNEL_NAME) or channel_name or "").strip()
             fetch_backlog = bool(user_input.get(CONF_FETCH_BACKLOG, fetch_backlog))
-        quality_values = [v for v, _ in QUALITY_OPTIONS]
-        if quality not in quality_values:
+        if quality not in QUALITY_VALUES:
             quality = DEFAULT_QUALITY
         return vol.Schema(
             {
                 vol.Required(CONF_METUBE_URL, default=url or "http://localhost:8081"): str,
-                vol.Required(CONF_QUALITY, default=quality): vol.In(quality_values),
+                vol.Required(CONF_QUALITY, default=quality): _QUALITY_IN,
                 vol.Required(CONF_CHANNEL_NAME, default=channel_name): str,
                 vol.Required(CONF_FETCH_BACKLOG, default=fetch_backlog): cv.boolean,
             }
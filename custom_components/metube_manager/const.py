@@ -39,6 +39,8 @@ QUALITY_OPTIONS: list[tuple[str, str]] = [
     ("worst", "Worst"),
 ]
 DEFAULT_QUALITY = "best"
+QUALITY_VALUE_LIST = tuple(v for v, _ in QUALITY_OPTIONS)  # Form choices, in display order
+QUALITY_VALUES = frozenset(QUALITY_VALUE_LIST)               # Membership checks
 
 # -----------------------------------------------------------------------------
 # YouTube RSS feed types (e.g. newskeeper-style URLs)
@@ -47,12 +49,30 @@ YOUTUBE_FEED_ALL = "all"
 YOUTUBE_FEED_VIDEOS = "videos"
 YOUTUBE_FEED_SHORTS = "shorts"
 YOUTUBE_FEED_LIVE = "live"
-YOUTUBE_FEED_TYPES = (YOUTUBE_FEED_ALL, YOUTUBE_FEED_VIDEOS, YOUTUBE_FEED_SHORTS, YOUTUBE_FEED_LIVE)
+YOUTUBE_FEED_TYPES = frozenset({YOUTUBE_FEED_ALL, YOUTUBE_FEED_VIDEOS, YOUTUBE_FEED_SHORTS, YOUTUBE_FEED_LIVE})
 
 # -----------------------------------------------------------------------------
 # Persistent storage and polling
 # -----------------------------------------------------------------------------
 STORAGE_KEY = "metube_manager_seen"
 STORAGE_VERSION = 1
-# How often to poll RSS feeds (used with async_track_time_interval)
+# Backlog/stats changes are written at most this long after the poll that made them
+STORE_SAVE_DELAY_SECONDS = 300
+# How often RSS feeds are polled (the poll runs on the wall clock, at the top of every hour)
 SCAN_INTERVAL = timedelta(hours=1)
+# Feed bodies larger than this are not downloaded (a feed URL pointing at something else)
+FEED_MAX_BYTES = 4 * 1024 * 1024
+# A channel's RSS feed fetched by the config flow (to read its title) gives up after this long
+FEED_FETCH_TIMEOUT_SECONDS = 10
+# Maximum number of RSS feeds fetched concurrently during one poll
+FEED_FETCH_CONCURRENCY = 8
+# Number of concurrent POSTs to MeTube /add during one poll
+METUBE_POST_CONCURRENCY = 4
+# Feed bodies up to this size are parsed with feedparser on the event loop (faster than a thread hop)
+FEEDPARSER_INLINE_MAX_BYTES = 16_384
+# A one-time playlist backlog sends at most this many videos (newest first, as yt-dlp lists them)
+BACKLOG_MAX_VIDEOS = 5_000
+# Seen-URL history per entry is compacted to the newest this many URLs once it grows to twice that
+SEEN_MAX_URLS = 10_000
+# New entries in the cross-entry seen index are written to disk in batches at most this often
+GLOBAL_SEEN_FLUSH_SECONDS = 300
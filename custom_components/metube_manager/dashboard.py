@@ -9,6 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 
+from .const import DOMAIN
+
 _LOGGER = logging.getLogger(__name__)
 
 DASHBOARD_URL_PATH = "metube-manager"
@@ -18,6 +20,16 @@ LOVELACE_DASHBOARDS_KEY = "lovelace_dashboards"
 LOVELACE_DASHBOARDS_VERSION = 1
 LOVELACE_CONFIG_KEY_TEMPLATE = "lovelace.{}"
 LOVELACE_CONFIG_VERSION = 1
+# Rows of each feed's card; "entity" is filled in with the feed sensor's entity id
+_FEED_ROWS_TEMPLATE: tuple[dict[str, Any], ...] = (
+    {"entity": None},
+    {"type": "attribute", "entity": None, "attribute": "channel_id", "name": "Channel ID"},
+    {"type": "attribute", "entity": None, "attribute": "rss_feed", "name": "Feed URL"},
+    {"type": "attribute", "entity": None, "attribute": "backlog_url", "name": "Backlog URL"},
+    {"type": "attribute", "entity": None, "attribute": "backlog_enabled", "name": "Backlog enabled"},
+    {"type": "attribute", "entity": None, "attribute": "videos_downloaded", "name": "Videos downloaded"},
+    {"type": "attribute", "entity": None, "attribute": "last_downloaded", "name": "Last downloaded", "format": "datetime"},
+)
 
 
 async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) -> None:
@@ -40,10 +52,24 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
 
     # Collect entities from ALL MeTube Manager config entries (one integration per channel).
     ent_reg = er.async_get(hass)
+    config_entries = hass.config_entries.async_entries("metube_manager")
+    by_entry: dict[str, list[er.RegistryEntry]]
+    if hasattr(ent_reg.entities, "get_entries_for_config_entry_id"):
+        # Registry is indexed by config entry: each lookup is cheap
+        by_entry = {
+            ce.entry_id: er.async_entries_for_config_entry(ent_reg, ce.entry_id) for ce in config_entries
+        }
+    else:
+        # Older registry: every lookup scans all entities, so group them in one pass instead
+        wanted = {ce.entry_id for ce in config_entries}
+        by_entry = {}
+        for reg_entry in ent_reg.entities.values():
+            if reg_entry.config_entry_id in wanted:
+                by_entry.setdefault(reg_entry.config_entry_id, []).append(reg_entry)
     all_feed_entries: list[tuple[str, str]] = []  # (entity_id, channel/feed name)
     status_entity_ids: list[str] = []
-    for config_entry in hass.config_entries.async_entries("metube_manager"):
-        for reg_entry in er.async_entries_for_config_entry(ent_reg, config_entry.entry_id):
+    for config_entry in config_entries:
+        for reg_entry in by_entry.get(config_entry.entry_id, ()):
             if not reg_entry.entity_id:
                 continue
             name = reg_entry.original_name or reg_entry.entity_id or ""
@@ -52,6 +78,19 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
             else:
                 all_feed_entries.append((reg_entry.entity_id, name))
 
+    # The dashboard is a function of these alone. Every entry setup lands here, so skip the
+    # rebuild and the write (and the browser reload it forces) when they match the last save
+    feed_cards: list[tuple[str, str, str]] = []  # (entity_id, channel/feed name, YouTube channel URL)
+    for eid, channel_name in all_feed_entries:
+        state = hass.states.get(eid)
+        attrs = (state.attributes or {}) if state else {}
+        feed_cards.append((eid, channel_name, attrs.get("youtube_channel_url") or ""))
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    signature = (tuple(status_entity_ids), tuple(feed_cards))
+    if domain_data.get("dashboard_signature") == signature:
+        _LOGGER.debug("MeTube Manager dashboard unchanged; not saving it")
+        return
+
     integrations_path = "/config/integrations"
     add_feeds_markdown = (
         f"**To add a channel:** [Settings → Devices & services]({integrations_path}) → **Add integration** → **MeTube Manager**. "
@@ -68,10 +107,7 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
             "entities": status_entity_ids,
         })
 
-    for eid, channel_name in all_feed_entries:
-        state = hass.states.get(eid)
-        attrs = (state.attributes or {}) if state else {}
-        youtube_url = attrs.get("youtube_channel_url") or ""
+    for eid, channel_name, youtube_url in feed_cards:
         rows: list[dict[str, Any]] = []
         if youtube_url:
             rows.append({
@@ -81,15 +117,7 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
                 "icon": "mdi:youtube",
                 "new_tab": True,
             })
-        rows.extend([
-            {"entity": eid},
-            {"type": "attribute", "entity": eid, "attribute": "channel_id", "name": "Channel ID"},
-            {"type": "attribute", "entity": eid, "attribute": "rss_feed", "name": "Feed URL"},
-            {"type": "attribute", "entity": eid, "attribute": "backlog_url", "name": "Backlog URL"},
-            {"type": "attribute", "entity": eid, "attribute": "backlog_enabled", "name": "Backlog enabled"},
-            {"type": "attribute", "entity": eid, "attribute": "videos_downloaded", "name": "Videos downloaded"},
-            {"type": "attribute", "entity": eid, "attribute": "last_downloaded", "name": "Last downloaded", "format": "datetime"},
-        ])
+        rows.extend([{**row, "entity": eid} for row in _FEED_ROWS_TEMPLATE])
         cards.append({
             "type": "entities",
             "title": channel_name or eid,
@@ -111,6 +139,7 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
             dash = lovelace_data.dashboards.get(DASHBOARD_URL_PATH)
             if dash is not None and hasattr(dash, "async_save"):
                 await dash.async_save(dashboard_config)
+                domain_data["dashboard_signature"] = signature
                 _LOGGER.info(
                     "MeTube Manager dashboard updated (entity list and link). Open from sidebar or /%s",
                     DASHBOARD_URL_PATH,
@@ -126,6 +155,7 @@ async def ensure_dashboard(hass: HomeAssistant, entry_id: str | None = None) ->
         LOVELACE_CONFIG_KEY_TEMPLATE.format(DASHBOARD_URL_PATH),
     )
     await config_store.async_save({"config": dashboard_config})
+    domain_data["dashboard_signature"] = signature
     try:
         hass.bus.async_fire("lovelace_updated", {"url_path": DASHBOARD_URL_PATH})
     except Exception:
@@ -0,0 +1,188 @@
+"""Extract video links from RSS/Atom feed bodies without building a full feedparser result."""
+
+from __future__ import annotations
+
+import io
+import re
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import unescape
+
+import feedparser
+
+# Local (namespace-free) tag names of the elements that hold one video each
+_ENTRY_TAGS = frozenset({"item", "entry"})
+
+# Channel and playlist feeds built by the config flow
+YOUTUBE_FEED_PREFIX = "https://www.youtube.com/feeds/videos.xml"
+# An entry's alternate link in YouTube's generated Atom, without crossing into the next entry
+_YOUTUBE_ENTRY_LINK_RE = re.compile(
+    rb'<entry>(?:[^<]|<(?!/entry>))*?<link rel="alternate" href="([^"]*)"'
+)
+
+
+def _local_name(tag: str) -> str:
+    """Tag name without its {namespace} prefix."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def looks_like_xml(head: bytes) -> bool:
+    """Whether a body's first bytes can start an XML document (a BOM and whitespace are skipped)."""
+    return head.lstrip(b"\xef\xbb\xbf").lstrip()[:1] in (b"<", b"")
+
+
+def looks_like_html(head: bytes) -> bool:
+    """Whether a body's first bytes are a web page rather than a feed: not XML, or an HTML document."""
+    head = head.lstrip(b"\xef\xbb\xbf").lstrip()[:14].lower()
+    return not looks_like_xml(head) or head.startswith((b"<!doctype html", b"<html"))
+
+
+class _LinkTarget:
+    """XMLParser target that records the link of each RSS <item> / Atom <entry> and nothing else.
+
+    An entry's link is its first direct <link> child with text (RSS) or with an href whose rel
+    is "alternate" (Atom). No elements are built, so titles, descriptions and media blocks cost
+    only the expat callbacks.
+    """
+
+    def __init__(self) -> None:
+        self.links: list[str] = []
+        self._depth = 0
+        self._entry_depth: int | None = None
+        self._link = ""
+        # Text and attributes of the <link> currently open inside an entry, if any
+        self._link_text: list[str] | None = None
+        self._link_attrib: dict[str, str] = {}
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        if self._entry_depth is None:
+            if _local_name(tag) in _ENTRY_TAGS:
+                self._entry_depth = self._depth
+                self._link = ""
+        elif (
+            not self._link
+            and self._depth == self._entry_depth + 1
+            and _local_name(tag) == "link"
+        ):
+            self._link_text = []
+            self._link_attrib = attrib
+
+    def data(self, data: str) -> None:
+        if self._link_text is not None:
+            self._link_text.append(data)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        if self._entry_depth is None:
+            return
+        if self._link_text is not None and depth == self._entry_depth + 1:
+            text = "".join(self._link_text).strip()
+            href = (self._link_attrib.get("href") or "").strip()
+            if text:
+                self._link = text
+            elif href and self._link_attrib.get("rel", "alternate") == "alternate":
+                self._link = href
+            self._link_text = None
+        elif depth == self._entry_depth:
+            if self._link:
+                self.links.append(self._link)
+            self._entry_depth = None
+
+    def close(self) -> list[str]:
+        return self.links
+
+
+class FeedLinkParser:
+    """Incremental link extractor: feed() body chunks as they arrive, links are collected as entries close.
+
+    Memory stays flat regardless of feed size since no element tree is kept.
+    Raises xml.etree.ElementTree.ParseError on malformed XML.
+    """
+
+    def __init__(self) -> None:
+        self._target = _LinkTarget()
+        self._parser = ET.XMLParser(target=self._target)
+
+    @property
+    def links(self) -> list[str]:
+        return self._target.links
+
+    def feed(self, data: bytes) -> None:
+        self._parser.feed(data)
+
+    def close(self) -> list[str]:
+        return self._parser.close()
+
+
+def is_youtube_feed(url: str) -> bool:
+    """Whether a feed URL is one of YouTube's own channel/playlist feeds."""
+    return url.startswith(YOUTUBE_FEED_PREFIX)
+
+
+class YouTubeLinkScanner:
+    """FeedLinkParser stand-in for YouTube feeds: a regex scan of the raw bytes, no XML parsing.
+
+    YouTube generates its feeds with a fixed layout, so one regex finds each entry's link.
+    close() raises xml.etree.ElementTree.ParseError when the body has entries but none
+    matched (the layout changed), so callers fall back to the same path as for broken XML.
+    """
+
+    def __init__(self) -> None:
+        self.links: list[str] = []
+        # Bytes after the last matched link (at most the feed header or one partial entry)
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self._buf += data
+        end = 0
+        for match in _YOUTUBE_ENTRY_LINK_RE.finditer(self._buf):
+            href = match.group(1).decode("utf-8", "replace").strip()
+            if "&" in href:
+                href = unescape(href, {"&quot;": '"', "&apos;": "'"})
+            if href:
+                self.links.append(href)
+            end = match.end()
+        if end:
+            del self._buf[:end]
+
+    def close(self) -> list[str]:
+        if not self.links and b"<entry" in self._buf:
+            raise ET.ParseError("no entry links matched the YouTube feed layout")
+        self._buf.clear()
+        return self.links
+
+
+def extract_links(body: bytes) -> list[str]:
+    """Links of every RSS item / Atom entry in a complete feed body.
+
+    Only <link> elements are looked at; dates, content and the rest of the entry are skipped.
+    Raises xml.etree.ElementTree.ParseError on malformed XML.
+    """
+    parser = FeedLinkParser()
+    parser.feed(body)
+    return parser.close()
+
+
+def _fast_link(item: dict) -> str:
+    """Entry link, read with plain dict.get before FeedParserDict.get's key-alias lookup."""
+    link = dict.get(item, "link") or item.get("link")
+    return link.strip() if link else ""
+
+
+def feedparser_links(body: bytes) -> list[str]:
+    """Fallback for feeds the XML parser rejects: let feedparser recover what it can.
+
+    Does no I/O, so small bodies may be parsed on the event loop.
+    """
+    # A stream, not bytes: given bytes, feedparser first tries open() on them as a file name.
+    # Links only: no HTML sanitizing of content or relative-URI rewriting
+    parsed = feedparser.parse(
+        io.BytesIO(body), sanitize_html=False, resolve_relative_uris=False
+    )
+    links: list[str] = []
+    for item in getattr(parsed, "entries", []) or []:
+        link = _fast_link(item)
+        if link:
+            links.append(link)
+    return links
@@ -0,0 +1,82 @@
+"""Seen-URL tracking for MeTube Manager.
+
+URLs are reduced to 64-bit fingerprints; only those are kept in memory and persisted, in an
+append-only binary file that this index is rebuilt from once per setup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from typing import Iterable
+
+# On-disk record: one little-endian unsigned 64-bit fingerprint
+FINGERPRINT_STRUCT = struct.Struct("<Q")
+
+
+def url_fingerprint(url: str) -> int:
+    """64-bit blake2b digest of url; collisions are negligible for any realistic history size."""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little")
+
+
+def pack_fingerprints(fingerprints: Iterable[int]) -> bytes:
+    """Serialize fingerprints as consecutive FINGERPRINT_STRUCT records."""
+    return b"".join(FINGERPRINT_STRUCT.pack(fp) for fp in fingerprints)
+
+
+def unpack_fingerprints(data: bytes) -> list[int]:
+    """Inverse of pack_fingerprints; a torn trailing record is ignored."""
+    size = FINGERPRINT_STRUCT.size
+    data = data[: len(data) - len(data) % size]
+    return [fp for (fp,) in FINGERPRINT_STRUCT.iter_unpack(data)]
+
+
+def append_fingerprints(path: str, fingerprints: list[int], max_count: int) -> list[int] | None:
+    """Append fingerprints to path; past 2 * max_count records, keep only the newest max_count.
+
+    Returns the kept fingerprints when the file was compacted, else None. Does blocking I/O.
+    """
+    with open(path, "ab") as f:
+        f.write(pack_fingerprints(fingerprints))
+    if os.path.getsize(path) <= 2 * max_count * FINGERPRINT_STRUCT.size:
+        return None
+    with open(path, "rb") as f:
+        kept = unpack_fingerprints(f.read())[-max_count:]
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pack_fingerprints(kept))
+    os.replace(tmp_path, path)
+    return kept
+
+
+class SeenUrls:
+    """Video URLs already sent to MeTube, kept as an exact set of 64-bit fingerprints.
+
+    History is compacted to SEEN_MAX_URLS (see append_fingerprints), so an exact set stays small
+    (8 bytes of key per URL plus set overhead) and never reports a new video as seen.
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: set[int] = set()
+
+    def __contains__(self, url: str) -> bool:
+        return url_fingerprint(url) in self._fingerprints
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def has_fingerprint(self, fp: int) -> bool:
+        return fp in self._fingerprints
+
+    def add(self, url: str) -> None:
+        self._fingerprints.add(url_fingerprint(url))
+
+    def add_fingerprint(self, fp: int) -> None:
+        self._fingerprints.add(fp)
+
+    def update(self, urls: Iterable[str]) -> None:
+        self._fingerprints.update(map(url_fingerprint, urls))
+
+    def update_fingerprints(self, fingerprints: Iterable[int]) -> None:
+        self._fingerprints.update(fingerprints)
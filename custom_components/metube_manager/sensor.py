@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import hashlib
 import re
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -23,15 +25,22 @@ from .const import (
 )
 
 
+# Runs of characters not allowed in an entity id slug
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@lru_cache(maxsize=512)
 def _slug(s: str, max_len: int = 30) -> str:
     """Safe slug for entity id."""
-    s = re.sub(r"[^a-zA-Z0-9]+", "_", (s or "").strip()).strip("_")[:max_len]
+    s = _SLUG_RE.sub("_", (s or "").strip()).strip("_")[:max_len]
     return s or "feed"
 
 
+@lru_cache(maxsize=512)
 def _feed_device_id(feed_url: str) -> str:
     """Stable device id for a feed (one device per feed)."""
-    return "feed_" + hashlib.sha256(feed_url.encode()).hexdigest()[:12]
+    # The digest is part of registered device identifiers, so it must stay sha256
+    return "feed_" + hashlib.sha256(feed_url.encode(), usedforsecurity=False).hexdigest()[:12]
 
 
 async def async_setup_entry(
@@ -40,9 +49,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MeTube Manager: one Status sensor on integration device, one device per feed with its sensor."""
-    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-    if not coordinator:
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not entry_data:
         return
+    coordinator = entry_data["coordinator"]
     options = entry.options or entry.data
     feeds = options.get(CONF_RSS_FEEDS) or []
     feed_list: list[tuple[str, str, str, str | None]] = []  # (feed_url, feed_name, backlog_url, channel_id?)
@@ -57,7 +67,7 @@ async def async_setup_entry(
         elif isinstance(f, str) and f.strip():
             feed_list.append((f.strip(), f.strip(), "", None))
     entities: list[SensorEntity] = [
-        MeTubeManagerSensor(entry),
+        MeTubeManagerSensor(entry, len(feed_list)),
     ]
     for feed_url, feed_name, backlog_url, channel_id in feed_list:
         entities.append(
@@ -72,7 +82,7 @@ class MeTubeManagerSensor(SensorEntity):
     _attr_has_entity_name = True
     _attr_name = "Status"
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    def __init__(self, entry: ConfigEntry, feed_count: int) -> None:
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_status"
         self._attr_device_info = {
@@ -80,18 +90,19 @@ class MeTubeManagerSensor(SensorEntity):
             "name": "MeTube Manager",
             "manufacturer": "MeTube Manager",
         }
+        # Options changes reload the entry, so these are fixed for the entity's life
+        # (feed_count is the number of feeds async_setup_entry parsed for this entry)
+        options = entry.options or entry.data
+        self._count = feed_count
+        base_url = (options.get("metube_url") or entry.data.get("metube_url") or "").rstrip("/")
+        self._attrs = {
+            "scan_interval": "Every hour",
+            "metube_url": base_url or None,
+        }
 
     @property
     def native_value(self) -> str:
-        options = self._entry.options or self._entry.data
-        feeds = options.get(CONF_RSS_FEEDS) or []
-        count = sum(
-            1
-            for f in feeds
-            if (isinstance(f, str) and f.strip())
-            or (isinstance(f, dict) and (f.get(CONF_FEED_URL) or f.get("url")))
-        )
-        return str(count)
+        return str(self._count)
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -99,12 +110,7 @@ class MeTubeManagerSensor(SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        options = self._entry.options or self._entry.data
-        base_url = (options.get("metube_url") or self._entry.data.get("metube_url") or "").rstrip("/")
-        return {
-            "scan_interval": "Every hour",
-            "metube_url": base_url or None,
-        }
+        return dict(self._attrs)
 
 
 class MeTubeManagerFeedSensor(CoordinatorEntity, SensorEntity):
@@ -129,7 +135,8 @@ class MeTubeManagerFeedSensor(CoordinatorEntity, SensorEntity):
         self._backlog_url = (backlog_url or "").strip()
         self._channel_id = (channel_id or "").strip() or None
         slug = _slug(self._feed_name)
-        url_hash = hashlib.md5(feed_url.encode()).hexdigest()[:10]
+        # md5 is kept for unique_id stability (entity registry); not a security use
+        url_hash = hashlib.md5(feed_url.encode(), usedforsecurity=False).hexdigest()[:10]
         self._attr_unique_id = f"{entry.entry_id}_feed_{slug}_{url_hash}"
         self._attr_name = "Videos downloaded"  # Device name is feed/channel name; avoid duplicating it
         device_id = _feed_device_id(feed_url)
@@ -138,40 +145,44 @@ class MeTubeManagerFeedSensor(CoordinatorEntity, SensorEntity):
             "name": self._feed_name,
             "manufacturer": "MeTube Manager",
         }
-
-    def _metube_url(self) -> str | None:
-        options = self._entry.options or self._entry.data or {}
-        url = (options.get(CONF_METUBE_URL) or "").rstrip("/")
-        return url or None
-
-    def _quality(self) -> str:
-        options = self._entry.options or self._entry.data or {}
-        return options.get(CONF_QUALITY) or DEFAULT_QUALITY
+        options = entry.options or entry.data or {}
+        self._metube_url = (options.get(CONF_METUBE_URL) or "").rstrip("/") or None
+        self._quality = options.get(CONF_QUALITY) or DEFAULT_QUALITY
+        # Everything but the download stats is fixed for the entity's life (an options
+        # change reloads the entry, which recreates the entity). The stats keys hold
+        # their place so the attribute order stays the same.
+        self._static_attrs: dict = {
+            "channel_id": self._channel_id,
+            "videos_downloaded": 0,
+            "last_downloaded": None,
+            "backlog_enabled": bool(self._backlog_url),
+            "backlog_url": self._backlog_url or None,
+            "metube_url": self._metube_url,
+            "quality": self._quality,
+        }
+        if self._channel_id:
+            self._static_attrs["youtube_channel_url"] = f"https://www.youtube.com/channel/{self._channel_id}"
+        if self._feed_url:
+            self._static_attrs["rss_feed"] = self._feed_url
+        # native_value is read on every state write; the string only changes with the total
+        self._last_total = 0
+        self._last_total_str = "0"
 
     @property
     def native_value(self) -> str:
         data = self.coordinator.data or {}
         stats = data.get(self._feed_url) or {}
         total = stats.get("total_sent") or 0
-        return str(total)
+        if total != self._last_total:
+            self._last_total = total
+            self._last_total_str = str(total)
+        return self._last_total_str
 
     @property
     def extra_state_attributes(self) -> dict:
         data = self.coordinator.data or {}
         stats = data.get(self._feed_url) or {}
-        last_fetched = stats.get("last_fetched")
-        total_sent = stats.get("total_sent") or 0
-        attrs: dict = {
-            "channel_id": self._channel_id,
-            "videos_downloaded": total_sent,
-            "last_downloaded": last_fetched,
-            "backlog_enabled": bool(self._backlog_url),
-            "backlog_url": self._backlog_url or None,
-            "metube_url": self._metube_url(),
-            "quality": self._quality(),
-        }
-        if self._channel_id:
-            attrs["youtube_channel_url"] = f"https://www.youtube.com/channel/{self._channel_id}"
-        if self._feed_url:
-            attrs["rss_feed"] = self._feed_url
-        return attrs
\ No newline at end of file
+        attrs = dict(self._static_attrs)
+        attrs["videos_downloaded"] = stats.get("total_sent") or 0
+        attrs["last_downloaded"] = stats.get("last_fetched")
+        return attrs
@@ -0,0 +1,134 @@
+"""Tests for the feed link parsers (loaded standalone; feed_links.py has no Home Assistant imports)."""
+
+import importlib.util
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("feedparser")
+
+_SPEC = importlib.util.spec_from_file_location(
+    "metube_manager_feed_links",
+    Path(__file__).resolve().parent.parent / "custom_components" / "metube_manager" / "feed_links.py",
+)
+feed_links = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(feed_links)
+
+RSS = (
+    b'<?xml version="1.0"?><rss><channel><title>c</title><link>https://site</link>'
+    b"<item><title>a</title><link> https://x/1 </link><description>d<b>x</b></description></item>"
+    b"<item><link></link><link>https://x/2</link></item>"
+    b"<item><guid>no-link</guid></item>"
+    b"</channel></rss>"
+)
+ATOM = (
+    b'<feed xmlns="http://www.w3.org/2005/Atom"><link href="https://self"/>'
+    b'<entry><link rel="self" href="https://s"/><link href="https://alt/1"/>'
+    b'<group><link href="https://nested"/></group></entry>'
+    b'<entry><link rel="replies" href="https://r"/></entry>'
+    b'<entry><link rel="alternate" href="https://alt/2"/></entry>'
+    b"</feed>"
+)
+
+
+def _youtube_feed(ids: list[str]) -> bytes:
+    entries = "".join(
+        f"<entry><id>yt:video:{i}</id><title>t</title>"
+        f'<link rel="alternate" href="https://www.youtube.com/watch?v={i}"/></entry>'
+        for i in ids
+    )
+    return (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Chan</title>{entries}</feed>"
+    ).encode()
+
+
+def _feed_in_chunks(parser, body: bytes, size: int) -> list[str]:
+    for start in range(0, len(body), size):
+        parser.feed(body[start : start + size])
+    return parser.close()
+
+
+def test_extract_links_rss_items() -> None:
+    assert feed_links.extract_links(RSS) == ["https://x/1", "https://x/2"]
+
+
+def test_extract_links_atom_alternate_links_only() -> None:
+    assert feed_links.extract_links(ATOM) == ["https://alt/1", "https://alt/2"]
+
+
+def test_extract_links_empty_feed() -> None:
+    assert feed_links.extract_links(b"<rss><channel><title>c</title></channel></rss>") == []
+
+
+def test_extract_links_malformed_raises() -> None:
+    with pytest.raises(ET.ParseError):
+        feed_links.extract_links(b"<rss><item></rss>")
+
+
+@pytest.mark.parametrize("size", [1, 7, 64])
+def test_feed_link_parser_chunked_matches_whole_body(size: int) -> None:
+    for body in (RSS, ATOM):
+        assert _feed_in_chunks(feed_links.FeedLinkParser(), body, size) == feed_links.extract_links(body)
+
+
+@pytest.mark.parametrize("size", [1, 13, 4096])
+def test_youtube_scanner_matches_xml_parser(size: int) -> None:
+    body = _youtube_feed([f"v{i:010d}" for i in range(20)])
+    links = _feed_in_chunks(feed_links.YouTubeLinkScanner(), body, size)
+    assert links == feed_links.extract_links(body)
+    assert len(links) == 20
+
+
+def test_youtube_scanner_unescapes_entities() -> None:
+    body = (
+        b'<feed><entry><link rel="alternate" href="https://www.youtube.com/watch?v=a&amp;t=1"/>'
+        b"</entry></feed>"
+    )
+    assert _feed_in_chunks(feed_links.YouTubeLinkScanner(), body, 5) == [
+        "https://www.youtube.com/watch?v=a&t=1"
+    ]
+
+
+def test_youtube_scanner_no_entries_is_empty() -> None:
+    assert _feed_in_chunks(feed_links.YouTubeLinkScanner(), _youtube_feed([]), 16) == []
+
+
+def test_youtube_scanner_raises_when_layout_changed() -> None:
+    body = b'<feed><entry><link href="https://www.youtube.com/watch?v=a" rel="alternate"/></entry></feed>'
+    with pytest.raises(ET.ParseError):
+        _feed_in_chunks(feed_links.YouTubeLinkScanner(), body, 1024)
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b'<?xml version="1.0"?><rss>', True),
+        (b"\xef\xbb\xbf \n <feed>", True),
+        (b"", True),
+        (b"{\"error\": 1}", False),
+        (b"\xef\xbb\xbfnot xml", False),
+    ],
+)
+def test_looks_like_xml(head: bytes, expected: bool) -> None:
+    assert feed_links.looks_like_xml(head) is expected
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"<!DOCTYPE html><html><body>", True),
+        (b"\xef\xbb\xbf  <HTML lang=en>", True),
+        (b"plain text", True),
+        (b'<?xml version="1.0"?><rss>', False),
+        (b'<feed xmlns="http://www.w3.org/2005/Atom">', False),
+    ],
+)
+def test_looks_like_html(head: bytes, expected: bool) -> None:
+    assert feed_links.looks_like_html(head) is expected
+
+
+def test_is_youtube_feed() -> None:
+    assert feed_links.is_youtube_feed("https://www.youtube.com/feeds/videos.xml?channel_id=UCx")
+    assert not feed_links.is_youtube_feed("https://example.com/feed.xml")
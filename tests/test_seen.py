@@ -0,0 +1,67 @@
+"""Tests for the seen-URL index (loaded standalone; seen.py has no Home Assistant imports)."""
+
+import importlib.util
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "metube_manager_seen",
+    Path(__file__).resolve().parent.parent / "custom_components" / "metube_manager" / "seen.py",
+)
+seen = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(seen)
+
+
+def _urls(prefix: str, n: int) -> list[str]:
+    return [f"https://www.youtube.com/watch?v={prefix}{i:08d}" for i in range(n)]
+
+
+def _fps(prefix: str, n: int) -> list[int]:
+    return [seen.url_fingerprint(u) for u in _urls(prefix, n)]
+
+
+def test_pack_unpack_round_trip() -> None:
+    fps = _fps("a", 100) + [0, 2**64 - 1]
+    data = seen.pack_fingerprints(fps)
+    assert len(data) == len(fps) * seen.FINGERPRINT_STRUCT.size
+    assert seen.unpack_fingerprints(data) == fps
+    assert seen.unpack_fingerprints(seen.pack_fingerprints([])) == []
+
+
+def test_unpack_ignores_torn_trailing_record() -> None:
+    fps = _fps("b", 3)
+    data = seen.pack_fingerprints(fps)
+    for torn in range(1, seen.FINGERPRINT_STRUCT.size):
+        assert seen.unpack_fingerprints(data + data[:torn]) == fps
+    assert seen.unpack_fingerprints(data[:5]) == []
+
+
+def test_index_holds_added_urls_and_fingerprints() -> None:
+    urls = _urls("c", 10)
+    index = seen.SeenUrls()
+    assert urls[0] not in index
+    index.update(urls[:5])
+    index.add(urls[5])
+    index.update_fingerprints(seen.url_fingerprint(u) for u in urls[6:9])
+    assert all(u in index for u in urls[:9])
+    assert urls[9] not in index
+    assert index.has_fingerprint(seen.url_fingerprint(urls[0]))
+    assert len(index) == 9
+
+
+def test_append_keeps_file_until_twice_max(tmp_path: Path) -> None:
+    path = str(tmp_path / "seen")
+    fps = _fps("d", 8)
+    assert seen.append_fingerprints(path, fps[:5], 4) is None
+    assert seen.append_fingerprints(path, fps[5:], 4) is None
+    with open(path, "rb") as f:
+        assert seen.unpack_fingerprints(f.read()) == fps
+
+
+def test_append_compacts_to_newest_max_past_twice_max(tmp_path: Path) -> None:
+    path = str(tmp_path / "seen")
+    fps = _fps("e", 9)
+    seen.append_fingerprints(path, fps[:8], 4)
+    assert seen.append_fingerprints(path, fps[8:], 4) == fps[-4:]
+    with open(path, "rb") as f:
+        assert seen.unpack_fingerprints(f.read()) == fps[-4:]
+    assert not (tmp_path / "seen.tmp").exists()